@@ -2,6 +2,7 @@ from zhenxun.configs.path_config import DATA_PATH, IMAGE_PATH
 from zhenxun.models.group_console import GroupConsole
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.task_info import TaskInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.utils.enum import BlockType, PluginType
 from zhenxun.utils.exception import GroupInfoNotFound
 from zhenxun.utils.image_utils import BuildImage, ImageTemplate, RowStyle
@@ -196,6 +197,7 @@ class PluginManage:
             await PluginInfo.filter(plugin_type=PluginType.NORMAL).update(
                 default_status=status
             )
+            AuthSnapshot.invalidate("plugin")
             return f'成功将所有功能进群默认状态修改为: {"开启" if status else "关闭"}'
         if group_id:
             if group := await GroupConsole.get_or_none(
@@ -218,6 +220,7 @@ class PluginManage:
         await PluginInfo.filter(plugin_type=PluginType.NORMAL).update(
             status=status, block_type=None if status else BlockType.ALL
         )
+        AuthSnapshot.invalidate("plugin")
         return f'成功将所有功能全局状态修改为: {"开启" if status else "关闭"}'
 
     @classmethod
@@ -246,6 +249,7 @@ class PluginManage:
         await GroupConsole.filter(group_id=group_id, channel_id__isnull=True).update(
             status=False
         )
+        AuthSnapshot.invalidate("group", group_id)
 
     @classmethod
     async def wake(cls, group_id: str):
@@ -257,6 +261,7 @@ class PluginManage:
         await GroupConsole.filter(group_id=group_id, channel_id__isnull=True).update(
             status=True
         )
+        AuthSnapshot.invalidate("group", group_id)
 
     @classmethod
     async def block(cls, module: str):
@@ -266,6 +271,7 @@ class PluginManage:
             module: 模块名
         """
         await PluginInfo.filter(module=module).update(status=False)
+        AuthSnapshot.invalidate("plugin")
 
     @classmethod
     async def unblock(cls, module: str):
@@ -275,6 +281,7 @@ class PluginManage:
             module: 模块名
         """
         await PluginInfo.filter(module=module).update(status=True)
+        AuthSnapshot.invalidate("plugin")
 
     @classmethod
     async def block_group_plugin(cls, plugin_name: str, group_id: str) -> str:
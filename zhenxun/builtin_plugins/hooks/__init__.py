@@ -3,6 +3,7 @@ from pathlib import Path
 import nonebot
 
 from zhenxun.configs.config import Config
+from zhenxun.services.auth_snapshot import AuthSnapshot
 
 Config.add_plugin_config(
     "hook",
@@ -49,4 +50,22 @@ Config.add_plugin_config(
     type=bool,
 )
 
+Config.add_plugin_config(
+    "hook",
+    "AUTH_SNAPSHOT_MAX_AGE",
+    600,
+    help="权限快照最大存活时间（秒），超时后从数据库重新加载，0 为不限制",
+    default_value=600,
+    type=int,
+)
+
+AuthSnapshot.max_age = Config.get_config("hook", "AUTH_SNAPSHOT_MAX_AGE") or 0
+
 nonebot.load_plugins(str(Path(__file__).parent.resolve()))
+
+driver = nonebot.get_driver()
+
+
+@driver.on_startup
+async def _():
+    await AuthSnapshot.load()
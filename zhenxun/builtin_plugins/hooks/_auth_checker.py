@@ -1,10 +1,8 @@
 from typing import ClassVar
 
-from nonebot.adapters import Bot, Event
 from nonebot.adapters.onebot.v11 import PokeNotifyEvent
 from nonebot.exception import IgnoredException
-from nonebot.matcher import Matcher
-from nonebot_plugin_alconna import At, UniMsg
+from nonebot_plugin_alconna import At
 from nonebot_plugin_session import EventSession
 from pydantic import BaseModel
 from tortoise.exceptions import IntegrityError
@@ -12,11 +10,11 @@ from tortoise.exceptions import IntegrityError
 from zhenxun.configs.config import Config
 from zhenxun.models.bot_console import BotConsole
 from zhenxun.models.group_console import GroupConsole
-from zhenxun.models.level_user import LevelUser
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.plugin_limit import PluginLimit
 from zhenxun.models.sign_user import SignUser
 from zhenxun.models.user_console import UserConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import (
     BlockType,
@@ -29,6 +27,8 @@ from zhenxun.utils.exception import InsufficientGold
 from zhenxun.utils.message import MessageUtils
 from zhenxun.utils.utils import CountLimiter, FreqLimiter, UserBlockLimiter
 
+from ._pipeline import AuthContext
+
 base_config = Config.get("hook")
 
 
@@ -215,64 +215,54 @@ class AuthChecker:
             return False
         return self._flmt_s.check(sid)
 
-    async def auth(
-        self,
-        matcher: Matcher,
-        event: Event,
-        bot: Bot,
-        session: EventSession,
-        message: UniMsg,
-    ):
+    async def auth(self, ctx: AuthContext):
         """权限检查
 
         参数:
-            matcher: matcher
-            bot: bot
-            session: EventSession
-            message: UniMsg
+            ctx: 检查上下文
         """
         is_ignore = False
         cost_gold = 0
-        user_id = session.id1
-        group_id = session.id3
-        channel_id = session.id2
-        if not group_id:
-            group_id = channel_id
-            channel_id = None
-        if matcher.type == "notice" and not isinstance(event, PokeNotifyEvent):
+        matcher = ctx.matcher
+        session = ctx.session
+        user_id = ctx.user_id
+        if matcher.type == "notice" and not isinstance(ctx.event, PokeNotifyEvent):
             """过滤除poke外的notice"""
             return
-        if user_id and matcher.plugin and (module_path := matcher.plugin.module_name):
-            try:
-                user = await UserConsole.get_user(user_id, session.platform)
-            except IntegrityError as e:
-                logger.debug(
-                    "重复创建用户，已跳过该次权限...",
-                    "AuthChecker",
-                    session=session,
-                    e=e,
-                )
-                return
-            if plugin := await PluginInfo.get_or_none(module_path=module_path):
+        if user_id and ctx.module_path:
+            if plugin := await ctx.get_plugin():
                 if plugin.plugin_type == PluginType.HIDDEN:
                     logger.debug(
                         f"插件: {plugin.name}:{plugin.module} "
                         "为HIDDEN，已跳过权限检查..."
                     )
                     return
+                if plugin.cost_gold:
+                    """仅在插件需要金币时查询用户"""
+                    try:
+                        user = await UserConsole.get_user(user_id, session.platform)
+                    except IntegrityError as e:
+                        logger.debug(
+                            "重复创建用户，已跳过该次权限...",
+                            "AuthChecker",
+                            session=session,
+                            e=e,
+                        )
+                        return
                 try:
-                    cost_gold = await self.auth_cost(user, plugin, session)
-                    if session.id1 in bot.config.superusers:
+                    if plugin.cost_gold:
+                        cost_gold = await self.auth_cost(user, plugin, session)
+                    if ctx.is_superuser:
                         if plugin.plugin_type == PluginType.SUPERUSER:
                             raise IsSuperuserException()
                         if not plugin.limit_superuser:
                             cost_gold = 0
                             raise IsSuperuserException()
-                    await self.auth_bot(plugin, bot.self_id)
-                    await self.auth_group(plugin, session, message)
-                    await self.auth_admin(plugin, session)
-                    await self.auth_plugin(plugin, session, event)
-                    await self.auth_limit(plugin, session)
+                    await self.auth_bot(plugin, ctx)
+                    await self.auth_group(plugin, ctx)
+                    await self.auth_admin(plugin, ctx)
+                    await self.auth_plugin(plugin, ctx)
+                    await self.auth_limit(plugin, ctx)
                 except IsSuperuserException:
                     logger.debug(
                         "超级用户或被ban跳过权限检测...", "AuthChecker", session=session
@@ -280,7 +270,7 @@ class AuthChecker:
                 except IgnoredException:
                     is_ignore = True
                     LimitManage.unblock(
-                        matcher.plugin.name, user_id, group_id, channel_id
+                        plugin.module, user_id, ctx.group_id, ctx.channel_id
                     )
                 except AssertionError as e:
                     is_ignore = True
@@ -292,7 +282,7 @@ class AuthChecker:
                     user_id,
                     cost_gold,
                     GoldHandle.PLUGIN,
-                    matcher.plugin.name if matcher.plugin else "",
+                    ctx.module or "",
                     session.platform,
                 )
             except InsufficientGold:
@@ -305,62 +295,49 @@ class AuthChecker:
         if is_ignore:
             raise IgnoredException("权限检测 ignore")
 
-    async def auth_bot(self, plugin: PluginInfo, bot_id: str):
+    async def auth_bot(self, plugin: PluginInfo, ctx: AuthContext):
         """机器人权限
 
         参数:
             plugin: PluginInfo
-            bot_id: bot_id
+            ctx: 检查上下文
         """
-        if not await BotConsole.get_bot_status(bot_id):
+        bot_data = await ctx.get_bot_data()
+        if not bot_data or not bot_data.status:
             logger.debug("Bot休眠中阻断权限检测...", "AuthChecker")
             raise IgnoredException("BotConsole休眠权限检测 ignore")
-        if await BotConsole.is_block_plugin(bot_id, plugin.module):
+        if BotConsole.format(plugin.module) in bot_data.block_plugins:
             logger.debug(
                 f"Bot插件 {plugin.name}({plugin.module}) 权限检查结果为关闭...",
                 "AuthChecker",
             )
             raise IgnoredException("BotConsole插件权限检测 ignore")
 
-    async def auth_limit(self, plugin: PluginInfo, session: EventSession):
+    async def auth_limit(self, plugin: PluginInfo, ctx: AuthContext):
         """插件限制
 
         参数:
             plugin: PluginInfo
-            session: EventSession
+            ctx: 检查上下文
         """
-        user_id = session.id1
-        group_id = session.id3
-        channel_id = session.id2
-        if not group_id:
-            group_id = channel_id
-            channel_id = None
         if plugin.module not in LimitManage.add_module:
-            limit_list: list[PluginLimit] = await plugin.plugin_limit.filter(
-                status=True
-            ).all()  # type: ignore
-            for limit in limit_list:
+            for limit in await AuthSnapshot.get_plugin_limits(plugin.id):
                 LimitManage.add_limit(limit)
-        if user_id:
+        if ctx.user_id:
             await LimitManage.check(
-                plugin.module, user_id, group_id, channel_id, session
+                plugin.module, ctx.user_id, ctx.group_id, ctx.channel_id, ctx.session
             )
 
-    async def auth_plugin(
-        self, plugin: PluginInfo, session: EventSession, event: Event
-    ):
+    async def auth_plugin(self, plugin: PluginInfo, ctx: AuthContext):
         """插件状态
 
         参数:
             plugin: PluginInfo
-            session: EventSession
+            ctx: 检查上下文
         """
-        group_id = session.id3
-        channel_id = session.id2
-        if not group_id:
-            group_id = channel_id
-            channel_id = None
-        if user_id := session.id1:
+        session = ctx.session
+        group_id = ctx.group_id
+        if user_id := ctx.user_id:
             if plugin.impression > 0:
                 sign_user = await SignUser.get_user(user_id)
                 if float(sign_user.impression) < plugin.impression:
@@ -378,9 +355,9 @@ class AuthChecker:
                     raise IgnoredException("好感度不足...")
             if group_id:
                 sid = group_id or user_id
-                if await GroupConsole.is_superuser_block_plugin(
-                    group_id, plugin.module
-                ):
+                module_format = GroupConsole.format(plugin.module)
+                group_list = await AuthSnapshot.get_group_list(group_id)
+                if any(module_format in g.superuser_block_plugin for g in group_list):
                     """超级用户群组插件状态"""
                     if self.is_send_limit_message(plugin, sid):
                         self._flmt_s.start_cd(group_id or user_id)
@@ -393,7 +370,11 @@ class AuthChecker:
                         session=session,
                     )
                     raise IgnoredException("超级管理员禁用了该群此功能...")
-                if await GroupConsole.is_normal_block_plugin(group_id, plugin.module):
+                if any(
+                    module_format in g.block_plugin
+                    for g in group_list
+                    if g.channel_id is None
+                ):
                     """群组插件状态"""
                     if self.is_send_limit_message(plugin, sid):
                         self._flmt_s.start_cd(group_id or user_id)
@@ -452,7 +433,7 @@ class AuthChecker:
                     raise IgnoredException("该插件在私聊中已被禁用...")
             if not plugin.status and plugin.block_type == BlockType.ALL:
                 """全局状态"""
-                if group_id and await GroupConsole.is_super_group(group_id):
+                if group_id and (group := await ctx.get_group()) and group.is_super:
                     raise IsSuperuserException()
                 logger.debug(
                     f"{plugin.name}({plugin.module}) 全局未开启此功能...",
@@ -464,17 +445,18 @@ class AuthChecker:
                     await MessageUtils.build_message("全局未开启此功能...").send()
                 raise IgnoredException("全局未开启此功能...")
 
-    async def auth_admin(self, plugin: PluginInfo, session: EventSession):
+    async def auth_admin(self, plugin: PluginInfo, ctx: AuthContext):
         """管理员命令 个人权限
 
         参数:
             plugin: PluginInfo
-            session: EventSession
+            ctx: 检查上下文
         """
-        user_id = session.id1
+        session = ctx.session
+        user_id = ctx.user_id
         if user_id and plugin.admin_level:
-            if group_id := session.id3 or session.id2:
-                if not await LevelUser.check_level(
+            if group_id := ctx.group_id:
+                if not await AuthSnapshot.check_level(
                     user_id, group_id, plugin.admin_level
                 ):
                     try:
@@ -500,7 +482,7 @@ class AuthChecker:
                         session=session,
                     )
                     raise IgnoredException("管理员权限不足...")
-            elif not await LevelUser.check_level(user_id, None, plugin.admin_level):
+            elif not await AuthSnapshot.check_level(user_id, None, plugin.admin_level):
                 try:
                     await MessageUtils.build_message(
                         f"你的权限不足喔，该功能需要的权限等级: {plugin.admin_level}"
@@ -516,20 +498,17 @@ class AuthChecker:
                 )
                 raise IgnoredException("权限不足")
 
-    async def auth_group(
-        self, plugin: PluginInfo, session: EventSession, message: UniMsg
-    ):
-        """群黑名单检测 群总开关检测
+    async def auth_group(self, plugin: PluginInfo, ctx: AuthContext):
+        """群总开关检测，群黑名单已在 ban 阶段检测
 
         参数:
             plugin: PluginInfo
-            session: EventSession
-            message: UniMsg
+            ctx: 检查上下文
         """
-        if not (group_id := session.id3 or session.id2):
+        if not ctx.group_id:
             return
-        text = message.extract_plain_text()
-        group = await GroupConsole.get_group(group_id)
+        session = ctx.session
+        group = await ctx.get_group()
         if not group:
             """群不存在"""
             logger.debug(
@@ -538,17 +517,9 @@ class AuthChecker:
                 session=session,
             )
             raise IgnoredException("群不存在")
-        if group.level < 0:
-            """群权限小于0"""
-            logger.debug(
-                "群黑名单, 群权限-1...",
-                "AuthChecker",
-                session=session,
-            )
-            raise IgnoredException("群黑名单")
         if not group.status:
             """群休眠"""
-            if text.strip() != "醒来":
+            if ctx.message.extract_plain_text().strip() != "醒来":
                 logger.debug("群休眠状态...", "AuthChecker", session=session)
                 raise IgnoredException("群休眠状态")
         if plugin.level > group.level:
@@ -0,0 +1,220 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import time
+from typing import Any, ClassVar
+
+from nonebot.adapters import Bot, Event
+from nonebot.exception import IgnoredException
+from nonebot.matcher import Matcher
+from nonebot_plugin_alconna import UniMsg
+from nonebot_plugin_session import EventSession
+
+from zhenxun.models.bot_console import BotConsole
+from zhenxun.models.group_console import GroupConsole
+from zhenxun.models.plugin_info import PluginInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
+from zhenxun.services.log import logger
+
+_UNSET: Any = object()
+
+
+class PipelineFinished(Exception):
+    """
+    跳过剩余的检查阶段，放行事件
+    """
+
+    pass
+
+
+@dataclass(slots=True)
+class AuthContext:
+    """
+    单次事件的检查上下文，用户，群组，bot，插件只解析一次
+    """
+
+    matcher: Matcher
+    event: Event
+    bot: Bot
+    session: EventSession
+    message: UniMsg
+    user_id: str | None = None
+    """用户id"""
+    group_id: str | None = None
+    """群组id，私聊时为None"""
+    channel_id: str | None = None
+    """频道id"""
+    module: str | None = None
+    """插件模块名"""
+    module_path: str | None = None
+    """插件模块路径"""
+    extra: dict = field(default_factory=dict)
+    """插件元数据extra"""
+    is_superuser: bool = False
+    """是否为超级用户"""
+    _plugin: Any = _UNSET
+    _group: Any = _UNSET
+    _bot_data: Any = _UNSET
+
+    @classmethod
+    def create(
+        cls,
+        matcher: Matcher,
+        event: Event,
+        bot: Bot,
+        session: EventSession,
+        message: UniMsg,
+    ) -> "AuthContext":
+        """创建上下文
+
+        参数:
+            matcher: Matcher
+            event: Event
+            bot: Bot
+            session: EventSession
+            message: UniMsg
+
+        返回:
+            AuthContext: 检查上下文
+        """
+        group_id = session.id3
+        channel_id = session.id2
+        if not group_id:
+            group_id = channel_id
+            channel_id = None
+        ctx = cls(
+            matcher=matcher,
+            event=event,
+            bot=bot,
+            session=session,
+            message=message,
+            user_id=session.id1,
+            group_id=group_id,
+            channel_id=channel_id,
+            is_superuser=session.id1 in bot.config.superusers,
+        )
+        if plugin := matcher.plugin:
+            ctx.module = plugin.name
+            ctx.module_path = plugin.module_name
+            if plugin.metadata:
+                ctx.extra = plugin.metadata.extra
+        return ctx
+
+    async def get_plugin(self) -> PluginInfo | None:
+        """获取插件信息"""
+        if self._plugin is _UNSET:
+            self._plugin = (
+                await AuthSnapshot.get_plugin(self.module_path)
+                if self.module_path
+                else None
+            )
+        return self._plugin
+
+    async def get_group(self) -> GroupConsole | None:
+        """获取群组信息"""
+        if self._group is _UNSET:
+            self._group = (
+                await AuthSnapshot.get_group(self.group_id) if self.group_id else None
+            )
+        return self._group
+
+    async def get_bot_data(self) -> BotConsole | None:
+        """获取bot信息"""
+        if self._bot_data is _UNSET:
+            self._bot_data = await AuthSnapshot.get_bot(self.bot.self_id)
+        return self._bot_data
+
+
+@dataclass(slots=True)
+class Stage:
+    name: str
+    """阶段名称"""
+    priority: int
+    """优先级，越小越先执行"""
+    func: Callable[[AuthContext], Awaitable[None]]
+    """检查方法"""
+    count: int = 0
+    """执行次数"""
+    block_count: int = 0
+    """阻断次数"""
+    total_time: float = 0
+    """总耗时（秒）"""
+
+
+class AuthPipeline:
+    """
+    事件预处理检查流水线，按优先级依次执行检查阶段
+
+    阶段抛出 IgnoredException 时阻断事件并跳过剩余阶段，
+    抛出 PipelineFinished 时放行事件并跳过剩余阶段
+    """
+
+    stages: ClassVar[list[Stage]] = []
+
+    @classmethod
+    def register(
+        cls, name: str, priority: int
+    ) -> Callable[
+        [Callable[[AuthContext], Awaitable[None]]],
+        Callable[[AuthContext], Awaitable[None]],
+    ]:
+        """注册检查阶段
+
+        参数:
+            name: 阶段名称
+            priority: 优先级，越小越先执行，开销小的阶段应当优先
+        """
+
+        def wrapper(
+            func: Callable[[AuthContext], Awaitable[None]],
+        ) -> Callable[[AuthContext], Awaitable[None]]:
+            if any(s.name == name for s in cls.stages):
+                raise ValueError(f"检查阶段 {name} 重复注册")
+            cls.stages.append(Stage(name=name, priority=priority, func=func))
+            cls.stages.sort(key=lambda s: s.priority)
+            return func
+
+        return wrapper
+
+    @classmethod
+    async def run(cls, ctx: AuthContext):
+        """执行检查
+
+        参数:
+            ctx: 检查上下文
+
+        异常:
+            IgnoredException: 事件被阻断
+        """
+        for stage in cls.stages:
+            start = time.perf_counter()
+            try:
+                await stage.func(ctx)
+            except PipelineFinished:
+                return
+            except IgnoredException:
+                stage.block_count += 1
+                logger.debug(
+                    f"检查阶段 {stage.name} 阻断了事件",
+                    "AuthPipeline",
+                    session=ctx.session,
+                )
+                raise
+            finally:
+                stage.count += 1
+                stage.total_time += time.perf_counter() - start
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, float]]:
+        """各阶段耗时统计
+
+        返回:
+            dict[str, dict[str, float]]: 执行次数，阻断次数，平均耗时（毫秒）
+        """
+        return {
+            s.name: {
+                "count": s.count,
+                "block": s.block_count,
+                "avg_ms": s.total_time / s.count * 1000 if s.count else 0,
+            }
+            for s in cls.stages
+        }
@@ -1,24 +1,25 @@
-from nonebot.adapters.onebot.v11 import Bot, Event
+from nonebot.adapters import Bot, Event
 from nonebot.matcher import Matcher
 from nonebot.message import run_postprocessor, run_preprocessor
 from nonebot_plugin_alconna import UniMsg
 from nonebot_plugin_session import EventSession
 
 from ._auth_checker import LimitManage, checker
+from ._pipeline import AuthContext, AuthPipeline
 
 
-# # 权限检测
+# 权限检测
+@AuthPipeline.register("auth", 30)
+async def _(ctx: AuthContext):
+    await checker.auth(ctx)
+
+
+# 检查流水线，ban检测，恶意触发检测，权限检测依次执行
 @run_preprocessor
 async def _(
     matcher: Matcher, event: Event, bot: Bot, session: EventSession, message: UniMsg
 ):
-    await checker.auth(
-        matcher,
-        event,
-        bot,
-        session,
-        message,
-    )
+    await AuthPipeline.run(AuthContext.create(matcher, event, bot, session, message))
 
 
 # 解除命令block阻塞
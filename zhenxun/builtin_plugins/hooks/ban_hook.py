@@ -1,19 +1,15 @@
-from nonebot.adapters import Bot, Event
 from nonebot.exception import IgnoredException
-from nonebot.matcher import Matcher
-from nonebot.message import run_preprocessor
-from nonebot.typing import T_State
 from nonebot_plugin_alconna import At
-from nonebot_plugin_session import EventSession
 
 from zhenxun.configs.config import Config
-from zhenxun.models.ban_console import BanConsole
-from zhenxun.models.group_console import GroupConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import PluginType
 from zhenxun.utils.message import MessageUtils
 from zhenxun.utils.utils import FreqLimiter
 
+from ._pipeline import AuthContext, AuthPipeline
+
 Config.add_plugin_config(
     "hook",
     "BAN_RESULT",
@@ -25,34 +21,24 @@ _flmt = FreqLimiter(300)
 
 
 # 检查是否被ban
-@run_preprocessor
-async def _(
-    matcher: Matcher, bot: Bot, event: Event, state: T_State, session: EventSession
-):
-    extra = {}
-    if plugin := matcher.plugin:
-        if metadata := plugin.metadata:
-            extra = metadata.extra
-            if extra.get("plugin_type") in [PluginType.HIDDEN]:
-                return
-    user_id = session.id1
-    group_id = session.id3 or session.id2
+@AuthPipeline.register("ban", 10)
+async def _(ctx: AuthContext):
+    if ctx.extra.get("plugin_type") in [PluginType.HIDDEN]:
+        return
+    if ctx.is_superuser:
+        return
+    user_id = ctx.user_id
+    group_id = ctx.group_id
     if group_id:
-        if user_id in bot.config.superusers:
-            return
-        if await BanConsole.is_ban(None, group_id):
+        if await AuthSnapshot.check_ban_time(None, group_id):
             logger.debug("群组处于黑名单中...", "ban_hook")
             raise IgnoredException("群组处于黑名单中...")
-        if g := await GroupConsole.get_group(group_id):
-            if g.level < 0:
-                logger.debug("群黑名单, 群权限-1...", "ban_hook")
-                raise IgnoredException("群黑名单, 群权限-1..")
+        if (g := await ctx.get_group()) and g.level < 0:
+            logger.debug("群黑名单, 群权限-1...", "ban_hook")
+            raise IgnoredException("群黑名单, 群权限-1..")
     if user_id:
         ban_result = Config.get_config("hook", "BAN_RESULT")
-        if user_id in bot.config.superusers:
-            return
-        if await BanConsole.is_ban(user_id, group_id):
-            time = await BanConsole.check_ban_time(user_id, group_id)
+        if time := await AuthSnapshot.check_ban_time(user_id, group_id):
             if time == -1:
                 time_str = "∞"
             else:
@@ -68,7 +54,7 @@ async def _(
                     else:
                         time_str = f"{minute} 分钟"
             if (
-                not extra.get("ignore_prompt")
+                not ctx.extra.get("ignore_prompt")
                 and time != -1
                 and ban_result
                 and _flmt.check(user_id)
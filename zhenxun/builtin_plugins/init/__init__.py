@@ -4,6 +4,7 @@ import nonebot
 from nonebot.adapters import Bot
 
 from zhenxun.models.group_console import GroupConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.platform import PlatformUtils
 
@@ -37,6 +38,7 @@ async def _(bot: Bot):
         await GroupConsole.bulk_create(create_list, 10)
     else:
         await GroupConsole.filter(group_id__in=update_id).update(group_flag=1)
+    AuthSnapshot.invalidate("group")
     logger.debug(
         f"更新Bot: {bot.self_id} 的群认证完成，共创建 {len(create_list)} 条数据，"
         f"共修改 {len(update_id)} 条数据..."
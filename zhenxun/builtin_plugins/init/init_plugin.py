@@ -12,6 +12,7 @@ from zhenxun.models.group_console import GroupConsole
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.plugin_limit import PluginLimit
 from zhenxun.models.task_info import TaskInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import (
     BlockType,
@@ -160,6 +161,7 @@ async def _():
     await data_migration()
     await PluginInfo.filter(module_path__in=load_plugin).update(load_status=True)
     await PluginInfo.filter(module_path__not_in=load_plugin).update(load_status=False)
+    AuthSnapshot.invalidate("plugin")
     manager.init()
     if limit_list:
         for limit in limit_list:
@@ -168,6 +170,7 @@ async def _():
                 manager.add(limit.module, limit)
     manager.save_file()
     await manager.load_to_db()
+    AuthSnapshot.invalidate("limit")
 
 
 async def data_migration():
@@ -415,5 +418,6 @@ async def group_migration():
                     )
                 if create_list:
                     await GroupConsole.bulk_create(create_list, 10)
+                AuthSnapshot.invalidate("group")
         group_file.unlink()
         logger.info("迁移群组数据完成!")
@@ -18,6 +18,7 @@ from zhenxun.models.group_console import GroupConsole
 from zhenxun.models.group_member_info import GroupInfoUser
 from zhenxun.models.level_user import LevelUser
 from zhenxun.models.plugin_info import PluginInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.common_utils import CommonUtils
 from zhenxun.utils.enum import RequestHandleType
@@ -241,6 +242,7 @@ class GroupManager:
                 )
                 raise ForceAddGroupError("强制拉群或未有群信息，退出群聊失败...") from e
             await GroupConsole.filter(group_id=group_id).delete()
+            AuthSnapshot.invalidate("group", group_id)
             raise ForceAddGroupError(f"触发强制入群保护，已成功退出群聊 {group_id}...")
         else:
             await cls.__handle_add_group(bot, group_id, group)
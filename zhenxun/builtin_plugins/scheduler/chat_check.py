@@ -10,6 +10,7 @@ from zhenxun.configs.config import Config
 from zhenxun.models.chat_history import ChatHistory
 from zhenxun.models.group_console import GroupConsole
 from zhenxun.models.task_info import TaskInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.platform import PlatformUtils
 
@@ -52,6 +53,7 @@ async def _():
                     )
     if update_list:
         await GroupConsole.bulk_update(update_list, ["block_task"], 10)
+        AuthSnapshot.invalidate("group")
 
 async def check_group_chat_activity(group, modules) -> bool:
     """
@@ -9,6 +9,7 @@ import ujson as json
 
 from zhenxun.configs.path_config import TEXT_PATH
 from zhenxun.models.group_console import GroupConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.http_utils import AsyncHttpx
 
@@ -93,3 +94,4 @@ async def _():
                     group.block_task = block_task.replace("<,", "")
             data_list.append(group)
         await GroupConsole.bulk_update(data_list, ["block_plugin", "block_task"], 10)
+        AuthSnapshot.invalidate("group")
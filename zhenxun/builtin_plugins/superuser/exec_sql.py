@@ -9,6 +9,7 @@ from tortoise import Tortoise
 from zhenxun.configs.config import BotConfig
 from zhenxun.configs.utils import PluginExtraData
 from zhenxun.models.ban_console import BanConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import PluginType
 from zhenxun.utils.image_utils import ImageTemplate
@@ -80,6 +81,7 @@ async def _(session: EventSession, message: UniMsg):
     try:
         if not sql_text.lower().startswith("select"):
             await BanConsole.raw(sql_text)
+            AuthSnapshot.invalidate()
         else:
             db = Tortoise.get_connection("default")
             res = await db.execute_query_dict(sql_text)
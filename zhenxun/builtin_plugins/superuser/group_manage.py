@@ -19,6 +19,7 @@ from nonebot_plugin_session import EventSession
 from zhenxun.configs.config import BotConfig
 from zhenxun.configs.utils import PluginExtraData
 from zhenxun.models.group_console import GroupConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import PluginType
 from zhenxun.utils.message import MessageUtils
@@ -203,6 +204,7 @@ async def _(bot: Bot, session: EventSession, arparma: Arparma, group_id: int):
             )
             await MessageUtils.build_message(f"退出群组 {group_id} 成功!").send()
             await GroupConsole.filter(group_id=group_id).delete()
+            AuthSnapshot.invalidate("group", group_id)
         except Exception as e:
             logger.error("退出群组失败", "退群", session=session, target=group_id, e=e)
             await MessageUtils.build_message(f"退出群组 {group_id} 失败...").send()
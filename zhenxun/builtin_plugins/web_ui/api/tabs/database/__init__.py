@@ -7,6 +7,7 @@ from tortoise import Tortoise
 from zhenxun.configs.config import BotConfig
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.task_info import TaskInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 
 from ....base_model import BaseResultModel, QueryModel, Result
@@ -99,6 +100,7 @@ async def _(sql: SqlText, request: Request) -> Result[list[dict]]:
             return Result.ok(res, "执行成功啦!")
         else:
             result = await TaskInfo.raw(sql.sql)
+            AuthSnapshot.invalidate()
             await SqlLog.add(ip or "0.0.0.0", sql.sql, str(result))
             return Result.ok(info="执行成功啦!")
     except Exception as e:
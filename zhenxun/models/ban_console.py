@@ -1,8 +1,11 @@
+from collections.abc import Iterable
 import time
 from typing_extensions import Self
 
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
 
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.db_context import Model
 from zhenxun.services.log import logger
 from zhenxun.utils.exception import UserAndGroupIsNone
@@ -28,6 +31,22 @@ class BanConsole(Model):
         table = "ban_console"
         table_description = "封禁人员/群组数据表"
 
+    async def save(
+        self,
+        using_db: BaseDBAsyncClient | None = None,
+        update_fields: Iterable[str] | None = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ):
+        """覆盖save方法，使权限快照失效"""
+        await super().save(using_db, update_fields, force_create, force_update)
+        AuthSnapshot.invalidate("ban", (self.user_id or "", self.group_id))
+
+    async def delete(self, using_db: BaseDBAsyncClient | None = None):
+        """覆盖delete方法，使权限快照失效"""
+        await super().delete(using_db)
+        AuthSnapshot.invalidate("ban", (self.user_id or "", self.group_id))
+
     @classmethod
     async def _get_data(cls, user_id: str | None, group_id: str | None) -> Self | None:
         """获取数据
@@ -1,7 +1,10 @@
+from collections.abc import Iterable
 from typing import Literal, overload
 
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
 
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.db_context import Model
 
 
@@ -29,6 +32,22 @@ class BotConsole(Model):
         table = "bot_console"
         table_description = "Bot数据表"
 
+    async def save(
+        self,
+        using_db: BaseDBAsyncClient | None = None,
+        update_fields: Iterable[str] | None = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ):
+        """覆盖save方法，使权限快照失效"""
+        await super().save(using_db, update_fields, force_create, force_update)
+        AuthSnapshot.invalidate("bot", self.bot_id)
+
+    async def delete(self, using_db: BaseDBAsyncClient | None = None):
+        """覆盖delete方法，使权限快照失效"""
+        await super().delete(using_db)
+        AuthSnapshot.invalidate("bot", self.bot_id)
+
     @staticmethod
     def format(name: str) -> str:
         return f"<{name},"
@@ -154,8 +173,10 @@ class BotConsole(Model):
             affected_rows = await cls.filter(bot_id=bot_id).update(status=status)
             if not affected_rows:
                 raise ValueError(f"未找到 bot_id: {bot_id}")
+            AuthSnapshot.invalidate("bot", bot_id)
         else:
             await cls.all().update(status=status)
+            AuthSnapshot.invalidate("bot")
 
     @overload
     @classmethod
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any, overload
 from typing_extensions import Self
 
@@ -6,6 +7,7 @@ from tortoise.backends.base.client import BaseDBAsyncClient
 
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.task_info import TaskInfo
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.db_context import Model
 from zhenxun.utils.enum import PluginType
 
@@ -51,6 +53,22 @@ class GroupConsole(Model):
         table_description = "群组信息表"
         unique_together = ("group_id", "channel_id")
 
+    async def save(
+        self,
+        using_db: BaseDBAsyncClient | None = None,
+        update_fields: Iterable[str] | None = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ):
+        """覆盖save方法，使权限快照失效"""
+        await super().save(using_db, update_fields, force_create, force_update)
+        AuthSnapshot.invalidate("group", self.group_id)
+
+    async def delete(self, using_db: BaseDBAsyncClient | None = None):
+        """覆盖delete方法，使权限快照失效"""
+        await super().delete(using_db)
+        AuthSnapshot.invalidate("group", self.group_id)
+
     @staticmethod
     def format(name: str) -> str:
         return f"<{name},"
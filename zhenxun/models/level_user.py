@@ -1,5 +1,9 @@
+from collections.abc import Iterable
+
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
 
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.db_context import Model
 
 
@@ -20,6 +24,22 @@ class LevelUser(Model):
         table_description = "用户权限数据库"
         unique_together = ("user_id", "group_id")
 
+    async def save(
+        self,
+        using_db: BaseDBAsyncClient | None = None,
+        update_fields: Iterable[str] | None = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ):
+        """覆盖save方法，使权限快照失效"""
+        await super().save(using_db, update_fields, force_create, force_update)
+        AuthSnapshot.invalidate("level", self.user_id)
+
+    async def delete(self, using_db: BaseDBAsyncClient | None = None):
+        """覆盖delete方法，使权限快照失效"""
+        await super().delete(using_db)
+        AuthSnapshot.invalidate("level", self.user_id)
+
     @classmethod
     async def get_user_level(cls, user_id: str, group_id: str | None) -> int:
         """获取用户在群内的等级
@@ -1,8 +1,11 @@
+from collections.abc import Iterable
 from typing_extensions import Self
 
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
 
 from zhenxun.models.plugin_limit import PluginLimit  # noqa: F401
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.db_context import Model
 from zhenxun.utils.enum import BlockType, PluginType
 
@@ -59,6 +62,22 @@ class PluginInfo(Model):
         table = "plugin_info"
         table_description = "插件基本信息"
 
+    async def save(
+        self,
+        using_db: BaseDBAsyncClient | None = None,
+        update_fields: Iterable[str] | None = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ):
+        """覆盖save方法，使权限快照失效"""
+        await super().save(using_db, update_fields, force_create, force_update)
+        AuthSnapshot.invalidate("plugin", self.module_path)
+
+    async def delete(self, using_db: BaseDBAsyncClient | None = None):
+        """覆盖delete方法，使权限快照失效"""
+        await super().delete(using_db)
+        AuthSnapshot.invalidate("plugin", self.module_path)
+
     @classmethod
     async def get_plugin(cls, load_status: bool = True, **kwargs) -> Self | None:
         """获取插件列表
@@ -0,0 +1,382 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .log import logger
+
+if TYPE_CHECKING:
+    from zhenxun.models.ban_console import BanConsole
+    from zhenxun.models.bot_console import BotConsole
+    from zhenxun.models.group_console import GroupConsole
+    from zhenxun.models.plugin_info import PluginInfo
+    from zhenxun.models.plugin_limit import PluginLimit
+
+LOG_COMMAND = "AuthSnapshot"
+
+
+class _Section:
+    """
+    快照分区，保存某一张表在内存中的数据
+    """
+
+    __slots__ = (
+        "data",
+        "fetch_all",
+        "fetch_one",
+        "hits",
+        "load_time",
+        "loaded",
+        "lock",
+        "misses",
+        "name",
+        "stale",
+        "version",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        fetch_all: Callable[[], Awaitable[dict[Any, Any]]],
+        fetch_one: Callable[[Any], Awaitable[Any]],
+    ):
+        self.name = name
+        self.fetch_all = fetch_all
+        self.fetch_one = fetch_one
+        self.data: dict[Any, Any] = {}
+        self.stale: set[Any] = set()
+        self.loaded = False
+        self.load_time = 0.0
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = asyncio.Lock()
+
+    def is_expired(self, max_age: int) -> bool:
+        return not self.loaded or bool(
+            max_age and time.time() - self.load_time > max_age
+        )
+
+    async def load(self, max_age: int | None = None):
+        async with self.lock:
+            if max_age is not None and not self.is_expired(max_age):
+                """等待锁期间已被其他协程加载"""
+                return
+            version = self.version
+            self.data = await self.fetch_all()
+            self.stale.clear()
+            """加载期间发生了写入，下次读取时重新加载"""
+            self.loaded = version == self.version
+            self.load_time = time.time()
+            self.version += 1
+
+    async def get(self, key: Any, max_age: int) -> Any:
+        if self.is_expired(max_age):
+            self.misses += 1
+            await self.load(max_age)
+            return self.data.get(key)
+        if key in self.stale:
+            self.misses += 1
+            value = await self.fetch_one(key)
+            self.stale.discard(key)
+            if value is None:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = value
+            return value
+        self.hits += 1
+        return self.data.get(key)
+
+    def invalidate(self, key: Any):
+        self.version += 1
+        self.stale.add(key)
+
+    def invalidate_all(self):
+        self.version += 1
+        self.loaded = False
+
+
+async def _fetch_plugins() -> dict[str, "PluginInfo"]:
+    from zhenxun.models.plugin_info import PluginInfo
+
+    return {p.module_path: p for p in await PluginInfo.all()}
+
+
+async def _fetch_plugin(module_path: str) -> "PluginInfo | None":
+    from zhenxun.models.plugin_info import PluginInfo
+
+    return await PluginInfo.get_or_none(module_path=module_path)
+
+
+async def _fetch_limits() -> dict[int, list["PluginLimit"]]:
+    from zhenxun.models.plugin_limit import PluginLimit
+
+    result: dict[int, list[PluginLimit]] = {}
+    for limit in await PluginLimit.filter(status=True).all():
+        result.setdefault(limit.plugin_id, []).append(limit)  # type: ignore
+    return result
+
+
+async def _fetch_limit(plugin_id: int) -> list["PluginLimit"]:
+    from zhenxun.models.plugin_limit import PluginLimit
+
+    return await PluginLimit.filter(plugin_id=plugin_id, status=True).all()
+
+
+async def _fetch_bots() -> dict[str, "BotConsole"]:
+    from zhenxun.models.bot_console import BotConsole
+
+    return {b.bot_id: b for b in await BotConsole.all()}
+
+
+async def _fetch_bot(bot_id: str) -> "BotConsole | None":
+    from zhenxun.models.bot_console import BotConsole
+
+    return await BotConsole.get_or_none(bot_id=bot_id)
+
+
+async def _fetch_groups() -> dict[str, dict[str | None, "GroupConsole"]]:
+    from zhenxun.models.group_console import GroupConsole
+
+    result: dict[str, dict[str | None, GroupConsole]] = {}
+    for group in await GroupConsole.all():
+        result.setdefault(group.group_id, {})[group.channel_id] = group
+    return result
+
+
+async def _fetch_group(group_id: str) -> dict[str | None, "GroupConsole"] | None:
+    from zhenxun.models.group_console import GroupConsole
+
+    if group_list := await GroupConsole.filter(group_id=group_id).all():
+        return {g.channel_id: g for g in group_list}
+    return None
+
+
+async def _fetch_levels() -> dict[str, dict[str, int]]:
+    from zhenxun.models.level_user import LevelUser
+
+    result: dict[str, dict[str, int]] = {}
+    for user_id, group_id, level in await LevelUser.all().values_list(
+        "user_id", "group_id", "user_level"
+    ):
+        result.setdefault(user_id, {})[group_id] = level
+    return result
+
+
+async def _fetch_level(user_id: str) -> dict[str, int] | None:
+    from zhenxun.models.level_user import LevelUser
+
+    if data_list := await LevelUser.filter(user_id=user_id).values_list(
+        "group_id", "user_level"
+    ):
+        return dict(data_list)  # type: ignore
+    return None
+
+
+async def _fetch_bans() -> dict[tuple[str, str | None], "BanConsole"]:
+    from zhenxun.models.ban_console import BanConsole
+
+    return {(b.user_id or "", b.group_id): b for b in await BanConsole.all()}
+
+
+async def _fetch_ban(key: tuple[str, str | None]) -> "BanConsole | None":
+    from zhenxun.models.ban_console import BanConsole
+
+    user_id, group_id = key
+    query = (
+        BanConsole.filter(group_id=group_id)
+        if group_id
+        else BanConsole.filter(group_id__isnull=True)
+    )
+    if user_id:
+        return await query.filter(user_id=user_id).first()
+    return await query.filter(user_id__in=["", None]).first()
+
+
+class AuthSnapshot:
+    """
+    权限检查所需数据的进程内快照
+
+    启动时加载 PluginInfo，PluginLimit，BotConsole，GroupConsole，LevelUser，
+    BanConsole 的数据，模型的写入方法会使对应的键失效，下次读取时仅重新查询该键
+    """
+
+    max_age: ClassVar[int] = 0
+    """快照最大存活时间（秒），超时后整个分区重新加载，0 为不限制"""
+
+    _sections: ClassVar[dict[str, _Section]] = {
+        "plugin": _Section("plugin", _fetch_plugins, _fetch_plugin),
+        "limit": _Section("limit", _fetch_limits, _fetch_limit),
+        "bot": _Section("bot", _fetch_bots, _fetch_bot),
+        "group": _Section("group", _fetch_groups, _fetch_group),
+        "level": _Section("level", _fetch_levels, _fetch_level),
+        "ban": _Section("ban", _fetch_bans, _fetch_ban),
+    }
+
+    @classmethod
+    async def load(cls, *names: str):
+        """加载快照
+
+        参数:
+            names: 分区名称，为空时加载全部分区
+        """
+        for name in names or cls._sections:
+            await cls._sections[name].load()
+        logger.debug(f"加载权限快照: {', '.join(names or cls._sections)}", LOG_COMMAND)
+
+    @classmethod
+    def invalidate(cls, name: str | None = None, key: Any = None):
+        """使快照失效
+
+        参数:
+            name: 分区名称，为空时使全部分区失效
+            key: 失效的键，为空时使整个分区失效
+        """
+        if name is None:
+            for section in cls._sections.values():
+                section.invalidate_all()
+        elif key is None:
+            cls._sections[name].invalidate_all()
+        else:
+            cls._sections[name].invalidate(key)
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, int]]:
+        """快照命中统计
+
+        返回:
+            dict[str, dict[str, int]]: 各分区的版本，数据量，命中与未命中次数
+        """
+        return {
+            name: {
+                "version": section.version,
+                "size": len(section.data),
+                "hits": section.hits,
+                "misses": section.misses,
+            }
+            for name, section in cls._sections.items()
+        }
+
+    @classmethod
+    async def get_plugin(cls, module_path: str) -> "PluginInfo | None":
+        """获取插件信息
+
+        参数:
+            module_path: 模块路径
+
+        返回:
+            PluginInfo | None: 插件信息
+        """
+        return await cls._sections["plugin"].get(module_path, cls.max_age)
+
+    @classmethod
+    async def get_plugin_limits(cls, plugin_id: int) -> list["PluginLimit"]:
+        """获取插件开启的限制
+
+        参数:
+            plugin_id: 插件id
+
+        返回:
+            list[PluginLimit]: 限制列表
+        """
+        return await cls._sections["limit"].get(plugin_id, cls.max_age) or []
+
+    @classmethod
+    async def get_bot(cls, bot_id: str) -> "BotConsole | None":
+        """获取bot数据
+
+        参数:
+            bot_id: bot_id
+
+        返回:
+            BotConsole | None: bot数据
+        """
+        return await cls._sections["bot"].get(bot_id, cls.max_age)
+
+    @classmethod
+    async def get_group(
+        cls, group_id: str, channel_id: str | None = None
+    ) -> "GroupConsole | None":
+        """获取群组
+
+        参数:
+            group_id: 群组id
+            channel_id: 频道id
+
+        返回:
+            GroupConsole | None: 群组
+        """
+        if data := await cls._sections["group"].get(group_id, cls.max_age):
+            return data.get(channel_id)
+        return None
+
+    @classmethod
+    async def get_group_list(cls, group_id: str) -> list["GroupConsole"]:
+        """获取群组下所有频道的数据
+
+        参数:
+            group_id: 群组id
+
+        返回:
+            list[GroupConsole]: 群组列表
+        """
+        if data := await cls._sections["group"].get(group_id, cls.max_age):
+            return list(data.values())
+        return []
+
+    @classmethod
+    async def check_level(cls, user_id: str, group_id: str | None, level: int) -> bool:
+        """检查用户权限等级是否大于 level
+
+        参数:
+            user_id: 用户id
+            group_id: 群组id
+            level: 权限等级
+
+        返回:
+            bool: 是否大于level
+        """
+        data: dict[str, int] | None = await cls._sections["level"].get(
+            user_id, cls.max_age
+        )
+        if not data:
+            return False
+        if group_id:
+            return group_id in data and data[group_id] >= level
+        return max(data.values()) >= level
+
+    @classmethod
+    async def get_ban(
+        cls, user_id: str | None, group_id: str | None
+    ) -> "BanConsole | None":
+        """获取封禁数据
+
+        参数:
+            user_id: 用户id
+            group_id: 群组id
+
+        返回:
+            BanConsole | None: 封禁数据
+        """
+        return await cls._sections["ban"].get((user_id or "", group_id), cls.max_age)
+
+    @classmethod
+    async def check_ban_time(cls, user_id: str | None, group_id: str | None) -> int:
+        """检测被ban时长，与 BanConsole.check_ban_time 一致，但不会访问数据库
+
+        参数:
+            user_id: 用户id
+            group_id: 群组id
+
+        返回:
+            int: ban剩余时长，-1时为永久ban，0表示未被ban
+        """
+        ban = await cls.get_ban(user_id, group_id)
+        if not ban and user_id and group_id:
+            ban = await cls.get_ban(user_id, None)
+        if not ban:
+            return 0
+        if ban.duration == -1:
+            return -1
+        _time = time.time() - (ban.ban_time + ban.duration)
+        return 0 if _time > 0 else int(_time)
@@ -16,6 +16,7 @@ from pydantic import BaseModel
 from zhenxun.configs.config import BotConfig
 from zhenxun.models.friend_user import FriendUser
 from zhenxun.models.group_console import GroupConsole
+from zhenxun.services.auth_snapshot import AuthSnapshot
 from zhenxun.services.log import logger
 from zhenxun.utils.exception import NotFindSuperuser
 from zhenxun.utils.http_utils import AsyncHttpx
@@ -323,6 +324,7 @@ class PlatformUtils:
             await GroupConsole.bulk_update(
                 update_list, ["group_name", "max_member_count", "member_count"], 10
             )
+            AuthSnapshot.invalidate("group")
         return len(create_list)
 
     @classmethod